@@ -80,7 +80,7 @@ def compile(
     )
 
     if custom_passes is not None:
-        ucc_default1.pass_manager.append(custom_passes)
+        ucc_default1.add_custom_passes(custom_passes)
 
     # Compile the circuit using the UCCDefault1 pass manager
     compiled_circuit = ucc_default1.run(
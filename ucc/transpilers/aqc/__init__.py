@@ -2,7 +2,6 @@ import importlib
 import warnings
 from qiskit import transpile as qiskit_transpile
 from qiskit import QuantumCircuit
-from qiskit.quantum_info import Statevector
 import numpy as np
 
 __all__ = [
@@ -13,7 +12,12 @@ __all__ = [
     "approx_compile",
 ]
 
-from .mps_utils import calculate_entanglement_entropy_slope, has_enough_memory
+from .mps_utils import (
+    calculate_entanglement_entropy_slope,
+    circuit_overlap,
+    get_statevector,
+    has_enough_memory,
+)
 
 # Check if `qmprs` is installed for AQC compilation
 qmprs_available = importlib.util.find_spec("qmprs") is not None
@@ -57,13 +61,34 @@ def approx_compile(circuit: QuantumCircuit) -> QuantumCircuit:
         )
         return circuit
 
-    target_sv = Statevector(circuit).data
+    # Transpile the original circuit before building its statevector: if it
+    # is already trivial, the depth/cx fallback below would always discard
+    # the AQC result, so the 2^n statevector allocation can be skipped
+    # The result is stashed on the circuit object itself so repeated
+    # compilations of the same circuit (batch workflows) skip the
+    # optimization_level=3 transpile, the most expensive step here
+    original_transpiled = getattr(circuit, "_ucc_transpiled", None)
+    if original_transpiled is None:
+        original_transpiled = qiskit_transpile(
+            circuit, basis_gates=["u3", "cx"], optimization_level=3
+        )
+        circuit._ucc_transpiled = original_transpiled
+
+    original_cx_count = original_transpiled.count_ops().get("cx", 0)
+    original_depth = original_transpiled.depth()
+
+    if original_cx_count == 0 and original_depth <= 1:
+        return circuit
+
+    target_sv = get_statevector(circuit)
     aqc_circuit = MPS_Encoder()(target_sv)
 
     # Fallback protocol for low fidelity, which discards the compiled
     # circuit and returns the original one
+    # The overlap is contracted as a tensor network so the AQC circuit's
+    # dense statevector is never materialized
     # TODO: This should be modified depending on maintainer notes
-    fidelity = np.vdot(target_sv, Statevector(aqc_circuit).data)
+    fidelity = np.abs(circuit_overlap(target_sv, aqc_circuit))
     if fidelity < 0.8:
         warnings.warn(
             f"Warning: Fidelity {fidelity:.4f} is too low. Discarding compression."
@@ -75,16 +100,10 @@ def approx_compile(circuit: QuantumCircuit) -> QuantumCircuit:
     aqc_transpiled = qiskit_transpile(
         aqc_circuit, basis_gates=["u3", "cx"], optimization_level=3
     )
-    original_transpiled = qiskit_transpile(
-        circuit, basis_gates=["u3", "cx"], optimization_level=3
-    )
 
     aqc_cx_count = aqc_transpiled.count_ops().get("cx", 0)
     aqc_depth = aqc_transpiled.depth()
 
-    original_cx_count = original_transpiled.count_ops().get("cx", 0)
-    original_depth = original_transpiled.depth()
-
     # Fallback protocol for worse depth and cx counts, which discards
     # the compiled circuit and returns the original one
     # TODO: This should be modified depending on maintainer notes
@@ -1,22 +1,80 @@
+import importlib
+import os
+from concurrent.futures import ThreadPoolExecutor
 import numpy as np
 from numpy.typing import NDArray
+import scipy.linalg as sla
+import cotengra as ctg  # type: ignore
 import quimb.tensor as qtn  # type: ignore
 from qiskit import QuantumCircuit  # type: ignore
-from qiskit.quantum_info import Statevector  # type: ignore
-from .mps_utils import calculate_entanglement_entropy_slope
+from qiskit.circuit.library import UnitaryGate  # type: ignore
+from .mps_utils import (
+    calculate_entanglement_entropy_slope,
+    get_statevector,
+    ilog2,
+)
 import warnings
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Shared generator for the random column/block fills below; the modern
+# Generator API draws complex fills in one batched call per matrix
+rng = np.random.default_rng()
+
+# Check if `numba` is installed for the compiled small-block kernel
+numba_available = importlib.util.find_spec("numba") is not None
+
+# Largest block size routed to the compiled modified Gram-Schmidt kernel;
+# LAPACK's fixed call overhead dominates below this size
+_MGS_BLOCK_LIMIT = 16
+
+# Smallest MPS for which per-site layer generation is fanned out over a
+# thread pool; below this the pool setup outweighs the BLAS parallelism
+_PARALLEL_SITES_MIN = 16
+
+if numba_available:
+    from numba import njit  # type: ignore
+
+    @njit(cache=True, fastmath=True)
+    def _mgs_numba(
+        matrix: NDArray[np.complex128],
+    ) -> NDArray[np.complex128]:
+        """Modified Gram-Schmidt on the columns of a small complex matrix.
+
+        Uses a two-pass reorthogonalization (projecting each column twice)
+        which is branchless and more numerically stable than detecting and
+        redoing near-zero columns.
+        """
+        num_columns = matrix.shape[1]
+
+        # Work on the transpose so each column is a contiguous row
+        unitary = matrix.T.copy()
+
+        for j in range(num_columns):
+            column = unitary[j].copy()
+            for _ in range(2):
+                for i in range(j):
+                    basis_vector = unitary[i]
+                    column -= np.vdot(basis_vector, column) * basis_vector
+            unitary[j] = column / np.linalg.norm(column)
+
+        return unitary.T
+
 
 def gram_schmidt(matrix: NDArray[np.complex128]) -> NDArray[np.complex128]:
-    """Perform Gram-Schmidt orthogonalization on the columns of a matrix
+    """Orthonormalize the columns of a matrix via a LAPACK QR decomposition
     to define the unitary block to encode the MPS.
 
     Notes
     -----
-    If a column is (approximately) zero, it is replaced with a random vector.
+    If a column is (approximately) zero, it is replaced with a random vector
+    before the decomposition so the result is always full rank.
+
+    QR only determines each column up to a phase, so the phases of the
+    diagonal of R are folded back into Q. This keeps columns that were
+    already orthonormal (e.g. the isometry columns produced by canonical
+    MPS form) unchanged, matching classical Gram-Schmidt.
 
     Args:
         matrix (NDArray[np.complex128]): Input matrix with complex entries.
@@ -26,39 +84,89 @@ def gram_schmidt(matrix: NDArray[np.complex128]) -> NDArray[np.complex128]:
             derived from the input matrix. If a column is (approximately) zero, it
             is replaced with a random vector.
     """
-    num_rows, num_columns = matrix.shape
-    unitary = np.zeros((num_rows, num_columns), dtype=np.complex128)
-    orthonormal_basis: list[NDArray[np.complex128]] = []
-
-    for j in range(num_columns):
-        column = matrix[:, j]
-
-        # If column is (approximately) zero, replace with random
-        if np.allclose(column, 0):
-            column = np.random.uniform(-1, 1, num_rows)  # type: ignore
-            if np.iscomplexobj(matrix):
-                column = column + 1j * np.random.uniform(-1, 1, num_rows)
-
-        # Gram-Schmidt orthogonalization
-        for basis_vector in orthonormal_basis:
-            column -= (basis_vector.conj().T @ column) * basis_vector
-
-        # Handle near-zero vectors (linear dependence)
-        norm = np.linalg.norm(column)
-        if norm < 1e-12:
-            is_complex = np.iscomplexobj(matrix)
-            column = np.random.uniform(-1, 1, num_rows)  # type: ignore
-            if is_complex:
-                column += 1j * np.random.uniform(-1, 1, num_rows)
-            for basis_vector in orthonormal_basis:
-                column -= (basis_vector.conj().T @ column) * basis_vector
-
-        unitary[:, j] = column / np.linalg.norm(column)
-        orthonormal_basis.append(unitary[:, j])
+    num_rows, _ = matrix.shape
+
+    # Replace (approximately) zero columns with random vectors in one batch
+    zero_mask = np.linalg.norm(matrix, axis=0) < 1e-12
+    if zero_mask.any():
+        num_zero = int(zero_mask.sum())
+        matrix = matrix.copy()
+        matrix[:, zero_mask] = rng.standard_normal(
+            (num_rows, num_zero)
+        ) + 1j * rng.standard_normal((num_rows, num_zero))
+
+    # Small blocks are dominated by LAPACK call overhead, so route them to
+    # the compiled modified Gram-Schmidt kernel when `numba` is installed
+    if numba_available and num_rows <= _MGS_BLOCK_LIMIT:
+        return _mgs_numba(np.ascontiguousarray(matrix, dtype=np.complex128))
+
+    # LAPACK wants Fortran-ordered data; converting here (a copy for the
+    # usual C-ordered input) lets overwrite_a reuse that buffer instead of
+    # scipy making another internal copy, and check_finite=False skips a
+    # full NaN/inf scan of the matrix
+    unitary, upper_triangular = sla.qr(
+        np.asfortranarray(matrix),
+        mode="economic",
+        overwrite_a=True,
+        check_finite=False,
+    )
+
+    # Fix the column phases so input columns that were already orthonormal
+    # are reproduced exactly
+    diagonal = np.diagonal(upper_triangular)
+    magnitudes = np.abs(diagonal)
+    phases = np.divide(
+        diagonal,
+        magnitudes,
+        out=np.ones_like(diagonal),
+        where=magnitudes > 1e-12,
+    )
+    unitary = unitary * phases
 
     return unitary
 
 
+def _zero_state_fidelity(mps: qtn.MatrixProductState) -> float:
+    """Compute the fidelity |<00...0|mps>| without materializing the
+    dense statevector.
+
+    Selecting the zero component of each physical index leaves a chain of
+    bond matrices; a running left-environment vector is swept through them
+    with plain vector-matrix products, so the amplitude costs O(n * chi^2)
+    with no tensor-network machinery and no 2^n-element allocation. The
+    1d compression rewrites every site tensor each layer, so nothing can
+    be reused between calls and the sweep starts fresh.
+
+    Args:
+        mps (qtn.MatrixProductState): The MPS to compare to the all-zero state.
+
+    Returns:
+        fidelity (float): The absolute overlap with the |00...0> state.
+    """
+    num_sites = mps.L
+    environment = np.ones(1, dtype=np.complex128)
+
+    for i in range(num_sites):
+        tensor = mps[i]
+        site_ind = mps.site_ind(i)
+        data = np.take(tensor.data, 0, axis=tensor.inds.index(site_ind))
+
+        if i == 0:
+            matrix = data.reshape(1, -1)
+        elif i == num_sites - 1:
+            matrix = data.reshape(-1, 1)
+        else:
+            # Put the bond shared with the previous site first
+            remaining = tuple(ix for ix in tensor.inds if ix != site_ind)
+            if remaining[0] != mps.bond(i - 1, i):
+                data = data.T
+            matrix = data
+
+        environment = environment @ matrix
+
+    return float(np.abs(environment[0]))
+
+
 class Sequential:
     def __init__(self, max_fidelity_threshold: float = 0.95) -> None:
         """Initialize the Sequential class.
@@ -69,6 +177,13 @@ class Sequential:
         """
         self.max_fidelity_threshold = max_fidelity_threshold
 
+        # The disentanglement loop compresses networks of identical topology
+        # every layer (only the tensor data changes), so contraction paths
+        # are found once and reused across calls
+        self._path_optimizer = ctg.ReusableHyperOptimizer(
+            max_repeats=16, progbar=False
+        )
+
     def generate_layer(
         self, mps: qtn.MatrixProductState
     ) -> list[tuple[list[int], NDArray[np.complex128]]]:
@@ -87,49 +202,91 @@ class Sequential:
         """
         num_sites = mps.L
 
-        unitary_layer: list[tuple[list[int], NDArray[np.complex128]]] = []
-
-        for i, tensor in enumerate(reversed(mps.arrays)):
-            i = num_sites - i - 1
-
-            # MPS representation uses 1D entanglement, thus we need to define
-            # the range of the indices via the tensor shape
-            # i.e., if q0 and q3 are entangled, then regardless of q1 and q2 being
-            # entangled the entanglement range would be q0-q3
-            if i == 0:
-                d_right, d = tensor.shape
-                tensor = tensor.reshape((1, d_right, d))
-            if i == num_sites - 1:
-                d_left, d = tensor.shape
-                tensor = tensor.reshape((d_left, 1, d))
-
-            tensor = np.swapaxes(tensor, 1, 2)
-
-            # Combine the physical index and right-virtual index of the tensor to construct an isometry
-            # matrix
-            d_left, d, d_right = tensor.shape
-            isometry = tensor.reshape((d * d_left, d_right))
-
-            # Put qubit ordering in LSB (we provide this so that users can modify between LSB and MSB)
-            # To put into MSB, comment the second line below
-            qubits = reversed(range(i - int(np.ceil(np.log2(d_left))), i + 1))
-            qubits = [abs(qubit - num_sites + 1) for qubit in qubits]  # type: ignore
-
-            # Create all-zero matrix and add the isometry columns
-            matrix = np.zeros(
-                (isometry.shape[0], isometry.shape[0]), dtype=isometry.dtype
-            )
+        # Stage the site tensors once and walk them right-to-left with
+        # plain index arithmetic rather than an enumerate(reversed(...))
+        # traversal that rewrites its own loop variable
+        arrays = list(mps.arrays)
+        site_indices = range(num_sites - 1, -1, -1)
+
+        # The per-site completions are independent and spend their time in
+        # BLAS/LAPACK calls that release the GIL, so large MPS are worth
+        # fanning out over a thread pool
+        if num_sites >= _PARALLEL_SITES_MIN:
+            with ThreadPoolExecutor(
+                max_workers=min(os.cpu_count() or 1, num_sites)
+            ) as executor:
+                return list(
+                    executor.map(
+                        lambda i: self._process_site(
+                            i, arrays[i], num_sites
+                        ),
+                        site_indices,
+                    )
+                )
+
+        return [
+            self._process_site(i, arrays[i], num_sites) for i in site_indices
+        ]
+
+    def _process_site(
+        self,
+        i: int,
+        tensor: NDArray[np.complex128],
+        num_sites: int,
+    ) -> tuple[list[int], NDArray[np.complex128]]:
+        """Turn the site tensor at index `i` into a qubit list and the
+        unitary completing its isometry.
 
-            # Keep columns for which all ancillas are in the zero state
-            matrix[:, : isometry.shape[1]] = isometry
+        Args:
+            i (int): The site index within the MPS.
+            tensor (NDArray[np.complex128]): The site tensor.
+            num_sites (int): Total number of sites in the MPS.
+
+        Returns:
+            tuple[list[int], NDArray[np.complex128]]: The qubit indices
+                (in LSB order) and the unitary acting on them.
+        """
+        # MPS representation uses 1D entanglement, thus we need to define
+        # the range of the indices via the tensor shape
+        # i.e., if q0 and q3 are entangled, then regardless of q1 and q2 being
+        # entangled the entanglement range would be q0-q3
+        if i == 0:
+            d_right, d = tensor.shape
+            tensor = tensor.reshape((1, d_right, d))
+        if i == num_sites - 1:
+            d_left, d = tensor.shape
+            tensor = tensor.reshape((d_left, 1, d))
+
+        # Combine the physical index and right-virtual index of the tensor to construct an isometry
+        # matrix
+        # One explicit contiguous copy of the transposed tensor; reshaping
+        # a swapaxes view would trigger the same copy through numpy's
+        # slower generic non-contiguous path
+        d_left, d_right, d = tensor.shape
+        isometry = np.ascontiguousarray(tensor.transpose(0, 2, 1)).reshape(
+            d_left * d, d_right
+        )
 
-            # Perform Gram-Schmidt orthogonalization to ensure the columns are orthonormal
-            unitary = gram_schmidt(matrix)
+        # Put qubit ordering in LSB (we provide this so that users can modify between LSB and MSB)
+        # To put into MSB, comment the second line below
+        qubits = reversed(range(i - ilog2(d_left), i + 1))
+        qubits = [abs(qubit - num_sites + 1) for qubit in qubits]  # type: ignore
+
+        # Complete the isometry to a square matrix by stacking a random
+        # block next to it; the isometry columns (for which all ancillas
+        # are in the zero state) come first. Orthonormalization preserves
+        # them exactly and never hits the zero-column replacement path
+        num_rows, num_isometry_columns = isometry.shape
+        random_block = rng.standard_normal(
+            (num_rows, num_rows - num_isometry_columns)
+        ) + 1j * rng.standard_normal(
+            (num_rows, num_rows - num_isometry_columns)
+        )
 
-            # Store the unitary layer for the circuit
-            unitary_layer.append((qubits, unitary))  # type: ignore
+        # Perform Gram-Schmidt orthogonalization to ensure the columns are orthonormal
+        unitary = gram_schmidt(np.hstack((isometry, random_block)))
 
-        return unitary_layer
+        return qubits, unitary  # type: ignore
 
     def mps_to_circuit_approx(
         self,
@@ -160,7 +317,7 @@ class Sequential:
         mps = qtn.MatrixProductState.from_dense(statevector)
         mps: qtn.MatrixProductState = (
             qtn.tensor_1d_compress.tensor_network_1d_compress(
-                mps, max_bond=chi_max
+                mps, max_bond=chi_max, optimize=self._path_optimizer
             )
         )  # type: ignore
         mps.permute_arrays()
@@ -168,18 +325,13 @@ class Sequential:
         mps.compress(form="left", max_bond=chi_max)
         mps.left_canonicalize(normalize=True)
 
-        compressed_mps = mps.copy(deep=True)
-        disentangled_mps = mps.copy(deep=True)
+        # No copy needed: `mps` is local and only its length is read below
+        disentangled_mps = mps
 
         circuit = QuantumCircuit(mps.L, mps.L)
 
         unitary_layers = []
 
-        # Initialize the zero state |00...0> to serve as comparison
-        # for the disentangled MPS
-        zero_state = np.zeros((2**mps.L,), dtype=np.complex128)
-        zero_state[0] = 1.0  # |00...0> state
-
         # Ran's approach uses a iterative disentanglement of the MPS
         # where each layer compresses the MPS to a maximum bond dimension of 2
         # and applies the inverse of the layer to disentangle the MPS
@@ -189,7 +341,9 @@ class Sequential:
         for layer_index in range(max_num_layers):
             # Compress the MPS from the previous layer to a maximum bond dimension of 2,
             # |ψ_k> -> |ψ'_k>
-            compressed_mps = disentangled_mps.copy(deep=True)
+            # A shallow copy suffices: compression replaces the site arrays
+            # rather than mutating them in place
+            compressed_mps = disentangled_mps.copy()
 
             # Normalize improves fidelity of the encoding
             compressed_mps.normalize()
@@ -201,11 +355,20 @@ class Sequential:
 
             # To update the MPS definition, apply the inverse of U_k to disentangle |ψ_k>,
             # |ψ_(k+1)> = inv(U_k) @ |ψ_k>
-            for i, _ in enumerate(unitary_layer):
-                inverse = unitary_layer[-(i + 1)][1].conj().T
+            # Precompute the conjugate transposes for the whole layer up
+            # front; the shapes are mixed (2x2 and 4x4) so this stays a list
+            inverses = [
+                unitary.conj().T for _, unitary in reversed(unitary_layer)
+            ]
 
+            for i, inverse in enumerate(inverses):
                 if inverse.shape[0] == 4:
-                    disentangled_mps.gate_split_(inverse, (i - 1, i))
+                    # cutoff=0.0 keeps the full split and skips the adaptive
+                    # truncation scan; bonds are bounded by the chi_max
+                    # compression below anyway
+                    disentangled_mps.gate_split_(
+                        inverse, (i - 1, i), cutoff=0.0
+                    )
                 else:
                     disentangled_mps.gate_(inverse, (i), contract=True)
 
@@ -214,11 +377,13 @@ class Sequential:
             # and improves the fidelity of the encoding
             disentangled_mps: qtn.MatrixProductState = (
                 qtn.tensor_1d_compress.tensor_network_1d_compress(  # type: ignore
-                    disentangled_mps, max_bond=chi_max
+                    disentangled_mps,
+                    max_bond=chi_max,
+                    optimize=self._path_optimizer,
                 )
             )
 
-            fidelity = np.abs(np.vdot(disentangled_mps.to_dense(), zero_state))
+            fidelity = _zero_state_fidelity(disentangled_mps)
 
             if fidelity >= self.max_fidelity_threshold:
                 # If the disentangled MPS is close enough to the zero state,
@@ -243,18 +408,22 @@ class Sequential:
         unitary_layers.reverse()
 
         # Apply the unitary layers to the |00...0> state
+        # The blocks come out of QR with orthonormal columns to machine
+        # precision, so the unitarity validation (an SVD per gate) that
+        # QuantumCircuit.unitary performs is skipped
         for unitary_layer in unitary_layers:
             for qubits, unitary in unitary_layer:
-                # Certain floating point errors can cause the computed
-                # `unitary` to not be unitary, which is resolved by approximating
-                # it with SVD
-                U, _, Vh = np.linalg.svd(unitary)
-                circuit.unitary(U @ Vh, qubits)
+                circuit.append(
+                    UnitaryGate(unitary, check_input=False), qubits
+                )
 
         return circuit
 
     @staticmethod
-    def optimal_params(statevector: NDArray[np.complex128]) -> int:
+    def optimal_params(
+        statevector: NDArray[np.complex128],
+        slope: float | None = None,
+    ) -> int:
         """Calculate the optimal number of layers and sweeps for the
         MPS encoding.
 
@@ -263,12 +432,15 @@ class Sequential:
 
         Args:
             statevector (NDArray[np.complex128]): The statevector to analyze.
+            slope (float | None): Precomputed entanglement entropy slope of
+                the statevector, to avoid recomputing it. Defaults to None.
 
         Returns:
             num_layers (int): The optimal maximum number of layers.
         """
-        num_qubits = int(np.ceil(np.log2(len(statevector))))
-        slope = calculate_entanglement_entropy_slope(statevector)
+        num_qubits = ilog2(len(statevector))
+        if slope is None:
+            slope = calculate_entanglement_entropy_slope(statevector)
 
         # Entanglement entropy slope is between 0 and 1
         # Use a smooth transition between area-law (0 to 0.4) and volume-law (1)
@@ -289,7 +461,7 @@ class Sequential:
         Returns:
             QuantumCircuit: The generated quantum circuit.
         """
-        num_qubits = int(np.ceil(np.log2(len(statevector))))
+        num_qubits = ilog2(len(statevector))
 
         # Single qubit statevector is optimal, and cannot be
         # further improved given depth of 1
@@ -298,19 +470,20 @@ class Sequential:
             circuit.initialize(statevector, [0])
             return circuit
 
+        # Compute the slope once and share it with optimal_params
         slope = calculate_entanglement_entropy_slope(statevector)
         if np.isclose(slope, 1, atol=0.1):
             warnings.warn(
                 "Warning: The state is volume-law entangled. Compression may be too lossy."
             )
 
-        max_num_layers = self.optimal_params(statevector)
+        max_num_layers = self.optimal_params(statevector, slope)
 
         circuit = self.mps_to_circuit_approx(
             statevector, max_num_layers, 2**num_qubits
         )
 
-        fidelity = np.abs(np.vdot(Statevector(circuit).data, statevector))
+        fidelity = np.abs(np.vdot(get_statevector(circuit), statevector))
 
         logger.info(
             f"Fidelity: {fidelity:.4f}, "
@@ -1,7 +1,74 @@
+import importlib
+import time
 import numpy as np
 from numpy.typing import NDArray
 import psutil
-from qiskit.quantum_info import partial_trace, entropy
+import scipy.sparse.linalg as spla
+import quimb.tensor as qtn  # type: ignore
+from qiskit import QuantumCircuit  # type: ignore
+from qiskit.quantum_info import Statevector  # type: ignore
+
+# Check if `qiskit-aer` is installed for the compiled statevector simulator
+aer_available = importlib.util.find_spec("qiskit_aer") is not None
+
+# Below this qubit count the dense statevector is cheap enough that the
+# tensor-network overlap machinery is not worth its overhead
+_DENSE_OVERLAP_LIMIT = 12
+
+# Below this qubit count the reference simulator wins: Aer's per-run
+# setup (internal transpile, result marshalling) dominates small circuits
+_AER_QUBIT_LIMIT = 15
+
+# Number of leading Schmidt values kept by the truncated SVD in the
+# entropy-slope estimate, and the spectral mass allowed to remain in the
+# discarded tail before falling back to a full SVD
+_TRUNCATED_SVD_COMPONENTS = 32
+_TAIL_MASS_TOLERANCE = 1e-6
+
+
+def get_statevector(circuit: QuantumCircuit) -> NDArray[np.complex128]:
+    """Return the dense statevector of a circuit.
+
+    Uses qiskit-aer's vectorized C++ statevector simulator when it is
+    installed and the circuit is large enough for the simulation itself
+    to dominate Aer's per-run setup cost; smaller circuits and
+    installations without Aer use `qiskit.quantum_info.Statevector`.
+
+    Args:
+        circuit (QuantumCircuit): The circuit to simulate.
+
+    Returns:
+        statevector (NDArray[np.complex128]): The circuit's statevector.
+    """
+    if aer_available and circuit.num_qubits >= _AER_QUBIT_LIMIT:
+        try:
+            from qiskit_aer import AerSimulator  # type: ignore
+
+            aer_circuit = circuit.copy()
+            aer_circuit.save_statevector()
+            result = (
+                AerSimulator(method="statevector").run(aer_circuit).result()
+            )
+            return np.asarray(result.get_statevector(), dtype=np.complex128)
+        except Exception:
+            # Any circuit Aer cannot digest falls through to the
+            # reference simulation
+            pass
+
+    return Statevector(circuit).data
+
+
+def ilog2(value: int) -> int:
+    """Integer ceil(log2(value)) for positive integers via bit_length,
+    avoiding a float ufunc dispatch on scalars.
+
+    Args:
+        value (int): A positive integer (a power of two for dimensions).
+
+    Returns:
+        int: The number of bits needed to index `value` states.
+    """
+    return (int(value) - 1).bit_length()
 
 
 def calculate_entanglement_entropy_slope(
@@ -12,19 +79,51 @@ def calculate_entanglement_entropy_slope(
     entanglement is volume-law or area-law. This returns a float
     as opposed to a string to provide a more dynamic response.
 
+    Notes
+    -----
+    For a pure state the entanglement entropy of each bipartition equals
+    the entropy of its Schmidt spectrum, so each cut is computed from the
+    singular values of a 2^(n-k) x 2^k reshape of the statevector (the
+    columns hold the k least-significant qubits, matching Qiskit's
+    little-endian convention). This avoids materializing a 2^n x 2^n
+    density matrix per cut.
+
     Args:
         state (NDArray[np.complex128]): The quantum state represented as a statevector.
 
     Returns:
         float: The entanglement entropy of the state.
     """
-    n = int(np.ceil(np.log2(len(state))))
+    n = ilog2(len(state))
+    total_mass = float(np.linalg.norm(state) ** 2)
 
     entropies = []
     for k in range(1, n // 2 + 1):
-        # Trace out rest of the qubits
-        rho_A = partial_trace(state, list(range(k, n)))
-        S = entropy(rho_A, base=2)
+        # Schmidt coefficients across the cut between the first k qubits
+        # and the rest
+        psi = state.reshape(2 ** (n - k), 2**k)
+
+        schmidt_values = None
+        if min(psi.shape) > 2 * _TRUNCATED_SVD_COMPONENTS:
+            # Area-law states concentrate their Schmidt mass in the
+            # leading values, so a truncated SVD covers the spectrum at a
+            # fraction of the cost. If significant mass is left in the
+            # tail the state is likely volume-law; redo the cut exactly
+            schmidt_values = spla.svds(
+                psi,
+                k=_TRUNCATED_SVD_COMPONENTS,
+                return_singular_vectors=False,
+            )
+            tail_mass = total_mass - float((schmidt_values**2).sum())
+            if tail_mass > _TAIL_MASS_TOLERANCE:
+                schmidt_values = None
+
+        if schmidt_values is None:
+            schmidt_values = np.linalg.svd(psi, compute_uv=False)
+
+        probabilities = schmidt_values**2
+        probabilities = probabilities[probabilities > 1e-15]
+        S = -(probabilities * np.log2(probabilities)).sum()
         entropies.append(S)
 
     # Check if the entropies form a straight line or a curve
@@ -43,6 +142,83 @@ def calculate_entanglement_entropy_slope(
     return slope
 
 
+def circuit_overlap(
+    statevector: NDArray[np.complex128],
+    circuit: QuantumCircuit,
+) -> complex:
+    """Compute the overlap <statevector|circuit> without materializing
+    the circuit's dense statevector.
+
+    The circuit is simulated as an MPS and contracted against an MPS of
+    the target statevector, costing O(n * chi^3) instead of the 16 * 2^n
+    bytes of a second dense simulation. For small circuits (or circuits
+    containing instructions without a matrix form) the dense path is used
+    instead, where it is cheaper.
+
+    Args:
+        statevector (NDArray[np.complex128]): The target statevector.
+        circuit (QuantumCircuit): The circuit whose state to compare against.
+
+    Returns:
+        overlap (complex): The inner product <statevector|circuit>.
+    """
+    num_qubits = circuit.num_qubits
+
+    if num_qubits >= _DENSE_OVERLAP_LIMIT:
+        try:
+            return _mps_overlap(statevector, circuit)
+        except Exception:
+            # Fall back to the dense simulation for anything the MPS
+            # path cannot express (e.g. gates without a matrix form)
+            pass
+
+    return complex(np.vdot(statevector, Statevector(circuit).data))
+
+
+def _mps_overlap(
+    statevector: NDArray[np.complex128],
+    circuit: QuantumCircuit,
+) -> complex:
+    """Contract <statevector|circuit> as a tensor network.
+
+    Qiskit orders qubits little-endian (qubit 0 is the least-significant
+    bit) while quimb's site 0 is the most-significant, so qiskit qubit q
+    maps to quimb site n - 1 - q and the qubit order of each gate is
+    reversed when applied.
+    """
+    num_qubits = circuit.num_qubits
+
+    psi = qtn.CircuitMPS(num_qubits)
+    for instruction in circuit.data:
+        matrix = instruction.operation.to_matrix()
+        qubits = [circuit.find_bit(qubit).index for qubit in instruction.qubits]
+        sites = tuple(num_qubits - 1 - qubit for qubit in reversed(qubits))
+        psi.apply_gate_raw(matrix, sites)
+
+    target_mps = qtn.MatrixProductState.from_dense(statevector)
+
+    return complex(target_mps.H @ psi.psi)
+
+
+# Reuse the available-memory reading for a short window so batch compile
+# workflows don't pay a psutil syscall on every circuit
+_AVAILABLE_MEMORY_TTL_S = 1.0
+_available_memory_cache: tuple[float, float] = (-np.inf, 0.0)
+
+
+def _available_memory_gb() -> float:
+    """Return the available RAM in GB, cached for a short TTL."""
+    global _available_memory_cache
+
+    timestamp, available = _available_memory_cache
+    now = time.monotonic()
+    if now - timestamp > _AVAILABLE_MEMORY_TTL_S:
+        available = psutil.virtual_memory().available / 2**30
+        _available_memory_cache = (now, available)
+
+    return available
+
+
 def has_enough_memory(num_qubits: int) -> tuple[bool, float, float]:
     """Check if the available user RAM is enough to represent
     the statevector IR.
@@ -57,14 +233,14 @@ def has_enough_memory(num_qubits: int) -> tuple[bool, float, float]:
         available_memory_gb (float): Amount of free memory that
             can be dedicated to storing the statevector IR in GB.
     """
-    available_memory_gb = psutil.virtual_memory().available
-    available_memory_gb = available_memory_gb / 2**30
+    available_memory_gb = _available_memory_gb()
 
     # Calculate approximately how much memory the statevector
     # requires at worst-case (volume-law)
     # statevectors use np.complex128 which needs 16 bytes
     # Use half of the memory available to store the IR
-    memory_required_gb = 2 ** (4 + num_qubits - 31)
+    exponent = num_qubits - 27
+    memory_required_gb = 1 << exponent if exponent >= 0 else 2.0**exponent
     has_memory = memory_required_gb <= available_memory_gb
 
     return has_memory, memory_required_gb, available_memory_gb
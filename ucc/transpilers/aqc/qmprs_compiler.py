@@ -3,7 +3,7 @@ from numpy.typing import NDArray
 from qmprs.synthesis.mps_encoding import Sequential as QmprsSequential  # type: ignore
 from quick.circuit import QiskitCircuit
 from qiskit import QuantumCircuit
-from .mps_utils import calculate_entanglement_entropy_slope
+from .mps_utils import calculate_entanglement_entropy_slope, ilog2
 import warnings
 import logging
 
@@ -29,7 +29,10 @@ class QmprsCompiler:
         self.sequential.fidelity_threshold = max_fidelity_threshold
 
     @staticmethod
-    def optimal_params(statevector: NDArray[np.complex128]) -> tuple[int, int]:
+    def optimal_params(
+        statevector: NDArray[np.complex128],
+        slope: float | None = None,
+    ) -> tuple[int, int]:
         """Calculate the optimal number of layers and sweeps for the
         MPS encoding.
 
@@ -38,12 +41,15 @@ class QmprsCompiler:
 
         Args:
             statevector (NDArray[np.complex128]): The statevector to analyze.
+            slope (float | None): Precomputed entanglement entropy slope of
+                the statevector, to avoid recomputing it. Defaults to None.
 
         Returns:
             tuple[int, int]: A tuple containing the number of layers and sweeps.
         """
-        num_qubits = int(np.ceil(np.log2(len(statevector))))
-        slope = calculate_entanglement_entropy_slope(statevector)
+        num_qubits = ilog2(len(statevector))
+        if slope is None:
+            slope = calculate_entanglement_entropy_slope(statevector)
 
         # Entanglement entropy slope is between 0 and 1
         # Use a smooth transition between area-law (0 to 0.4) and volume-law (1)
@@ -62,13 +68,14 @@ class QmprsCompiler:
         Returns:
             QuantumCircuit: The generated quantum circuit.
         """
+        # Compute the slope once and share it with optimal_params
         slope = calculate_entanglement_entropy_slope(statevector)
         if np.isclose(slope, 1, atol=0.1):
             warnings.warn(
                 "Warning: The state is volume-law entangled. Compression may be too lossy."
             )
 
-        num_qubits = int(np.ceil(np.log2(len(statevector))))
+        num_qubits = ilog2(len(statevector))
 
         # Single qubit statevector is optimal, and cannot be
         # further improved given depth of 1
@@ -77,7 +84,7 @@ class QmprsCompiler:
             circuit.initialize(statevector, [0])
             return circuit
 
-        num_layers, num_sweeps = self.optimal_params(statevector)
+        num_layers, num_sweeps = self.optimal_params(statevector, slope)
 
         circuit = self.sequential.prepare_state(
             statevector=statevector,
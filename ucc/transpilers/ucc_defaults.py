@@ -1,5 +1,7 @@
 # Construct a custom compiler
+import functools
 import os
+import weakref
 
 try:
     from qiskit.utils.parallel import default_num_processes
@@ -11,17 +13,21 @@ except ImportError:
         return CPU_COUNT
 
 
+from qiskit.passmanager.flow_controllers import DoWhileController
 from qiskit.providers import Backend
-from qiskit.transpiler import PassManager
-from qiskit import user_config
+from qiskit.transpiler import PassManager, StagedPassManager, Target
+from qiskit import QuantumCircuit, user_config
 from qiskit.transpiler import generate_preset_pass_manager
+from qiskit.transpiler.basepasses import AnalysisPass
 from qiskit.transpiler.passes import (
     ConsolidateBlocks,
     CollectCliffords,
+    FixedPoint,
     HighLevelSynthesis,
     HLSConfig,
     CommutativeCancellation,
     Collect2qBlocks,
+    Size,
     UnitarySynthesis,
     Optimize1qGatesDecomposition,
 )
@@ -30,9 +36,99 @@ from typing import Optional
 
 CONFIG = user_config.get_config()
 
+# User config and environment don't change mid-run, and the CPU count is
+# stable, so resolve them once at import instead of per call
+_SABRE_ALL_THREADS = bool(
+    CONFIG.get("sabre_all_threads", None)
+    or os.getenv("QISKIT_SABRE_ALL_THREADS")
+)
+_DEFAULT_NUM_PROCESSES = default_num_processes()
+
+# Safety cap on the size-driven optimization loop in case the circuit
+# size oscillates instead of reaching a fixed point
+_MAX_LOCAL_LOOPS = 10
+
+# HLSConfig validates its plugin arguments on construction, so share one
+# immutable config across every pass block rather than rebuilding it per
+# gateset
+_HLS_CLIFFORD_GREEDY = HLSConfig(clifford=["greedy"])
+
+
+# Per-Target memo of the gateset derived from its operation names. A
+# Target's operations never change after construction, so repeated
+# UCCDefault1 instances against the same backend reuse the frozenset
+# instead of re-walking the operation table
+_target_gateset_cache: "weakref.WeakKeyDictionary" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _target_gateset(target):
+    """Return the (cached) frozenset of a Target's operation names."""
+    try:
+        return _target_gateset_cache[target]
+    except (KeyError, TypeError):
+        # TypeError: target is not weak-referenceable; compute uncached
+        gateset = frozenset(target.operation_names)
+        try:
+            _target_gateset_cache[target] = gateset
+        except TypeError:
+            pass
+        return gateset
+
+
+class _CountLocalLoops(AnalysisPass):
+    """Count the iterations of the local optimization loop in the
+    property set, so the loop condition can cap them per run."""
+
+    def run(self, dag):
+        self.property_set["ucc_local_loop_count"] = (
+            self.property_set.get("ucc_local_loop_count", 0) + 1
+        )
+
+
+def _keep_optimizing(property_set):
+    """Loop condition: repeat the local block until the circuit size
+    stops improving, bounded by the iteration cap."""
+    return (
+        not property_set["size_fixed_point"]
+        and property_set["ucc_local_loop_count"] < _MAX_LOCAL_LOOPS
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def _build_local_passes(target_gateset, local_iterations):
+    """Construct the block of local optimization passes.
+
+    Cached per (gateset, iterations) so repeated UCCDefault1 instances
+    share the pass objects, whose internal tables (e.g. UnitarySynthesis
+    basis caches) are expensive to warm. qiskit passes hold no per-run
+    state, so sharing them across pass managers is safe.
+
+    Args:
+        target_gateset (frozenset[str]): The gateset to synthesize to.
+        local_iterations (int): Number of repetitions of the block.
+
+    Returns:
+        tuple: The pass instances, in execution order.
+    """
+    # Passes are stateless between runs, so one set of instances can be
+    # repeated for every iteration rather than constructed per iteration
+    block = [
+        Optimize1qGatesDecomposition(),
+        CommutativeCancellation(),
+        Collect2qBlocks(),
+        ConsolidateBlocks(force_consolidate=True),
+        UnitarySynthesis(basis_gates=target_gateset),
+        CollectCliffords(),
+        HighLevelSynthesis(hls_config=_HLS_CLIFFORD_GREEDY),
+    ]
+
+    return tuple(block * local_iterations)
+
 
 class UCCDefault1:
-    DEFAULT_GATESET = {"cx", "rz", "rx", "ry", "h"}
+    DEFAULT_GATESET = frozenset({"cx", "rz", "rx", "ry", "h"})
 
     def __init__(
         self,
@@ -51,21 +147,22 @@ class UCCDefault1:
         If neither target_backend or target_gateset resolve to a gateset, defaults to {"cx", "rz", "rx", "ry", "h"}.
 
         """
-        self.pass_manager = PassManager()
         self.target_backend = target_backend
+        self._custom_passes = []
 
         if self.target_backend is None:
             # If no backend is provided, use the provided gateset or default gateset
+            # Frozen so the gateset is hashable for the pass-block cache
             self.target_gateset = (
-                target_gateset
+                frozenset(target_gateset)
                 if target_gateset is not None
                 else self.DEFAULT_GATESET
             )
-        elif hasattr(self.target_backend, "target") and hasattr(
-            self.target_backend.target, "operation_names"
+        elif isinstance(
+            getattr(self.target_backend, "target", None), Target
         ):
             # If a backend is provided, use its target's operation names as the gateset
-            self.target_gateset = self.target_backend.target.operation_names
+            self.target_gateset = _target_gateset(self.target_backend.target)
         else:
             raise ValueError(
                 "Provided backend does not provide a target with operation names"
@@ -82,25 +179,66 @@ class UCCDefault1:
     def default_passes(self):
         return
 
+    @classmethod
+    def clear_cache(cls):
+        """Drop the cached local pass blocks, forcing reconstruction on
+        the next instantiation."""
+        _build_local_passes.cache_clear()
+
     def _add_local_passes(self, local_iterations):
-        for _ in range(local_iterations):
-            self.pass_manager.append(Optimize1qGatesDecomposition())
-            self.pass_manager.append(CommutativeCancellation())
-            self.pass_manager.append(Collect2qBlocks())
-            self.pass_manager.append(ConsolidateBlocks(force_consolidate=True))
-            self.pass_manager.append(
-                UnitarySynthesis(basis_gates=self.target_gateset)
-            )
-            # self.pass_manager.append(Optimize1qGatesDecomposition(basis=self._1q_basis))
-            self.pass_manager.append(CollectCliffords())
-            self.pass_manager.append(
-                HighLevelSynthesis(hls_config=HLSConfig(clifford=["greedy"]))
-            )
+        # The block is cached across instances; the enclosing pass
+        # managers stay per-instance so user-appended custom passes never
+        # leak into the cache
+        block = _build_local_passes(self.target_gateset, local_iterations)
+
+        # Run the block until the circuit size reaches a fixed point
+        # instead of a fixed number of times: circuits that stop improving
+        # exit early and circuits that keep shrinking get extra sweeps,
+        # capped to guard against size oscillation
+        local_stage = PassManager(
+            [
+                DoWhileController(
+                    # recurse so circuits with control flow report a size
+                    # instead of raising
+                    [
+                        *block,
+                        _CountLocalLoops(),
+                        Size(recurse=True),
+                        FixedPoint("size"),
+                    ],
+                    do_while=_keep_optimizing,
+                )
+            ]
+        )
+
+        # Staged so the empty custom stage is skipped outright by the
+        # dispatcher until passes are attached, and either stage can be
+        # replaced without rebuilding the whole pipeline
+        self.pass_manager = StagedPassManager(
+            stages=["local", "custom"], local=local_stage
+        )
+
+        # Add following passes if merging single qubit rotations that are interrupted by a commuting 2 qubit gate is desired
+        # self.pass_manager.append(Optimize1qGatesSimpleCommutation(basis=self._1q_basis))
 
-            # Add following passes if merging single qubit rotations that are interrupted by a commuting 2 qubit gate is desired
-            # self.pass_manager.append(Optimize1qGatesSimpleCommutation(basis=self._1q_basis))
+    def add_custom_passes(self, custom_passes):
+        """Attach passes to run after the default pipeline.
 
-    def run(self, circuits, callback=None):
+        Args:
+            custom_passes (list[qiskit.transpiler.TransformationPass]):
+                Passes to run after the local optimization stage, in order.
+        """
+        self._custom_passes.extend(custom_passes)
+        if "custom" in getattr(self.pass_manager, "stages", ()):
+            # Stage assignment (rather than in-place mutation) so the
+            # staged dispatcher rebuilds its task list
+            self.pass_manager.custom = PassManager(
+                list(self._custom_passes)
+            )
+        else:
+            self.pass_manager.append(custom_passes)
+
+    def run(self, circuits, callback=None, num_processes=None):
         """
         Run the pass manager on the given circuit(s).
 
@@ -114,13 +252,48 @@ class UCCDefault1:
                     time (float): the time to execute the pass
                     property_set (PropertySet): the property set
                     count (int): the index for the pass execution
+                num_processes (int): (Optional) Number of worker processes used
+                    when `circuits` is a list. Independent circuits are
+                    embarrassingly parallel, and qiskit ships the pass manager
+                    to each worker once so only circuits cross the pickle
+                    boundary. Defaults to qiskit's user config / environment
+                    settings (serial for a single circuit).
         """
-        return self.pass_manager.run(circuits, callback=callback)
+        # Circuits with no instructions cannot be optimized further, so
+        # skip the pass-manager dispatch entirely — but only when nothing
+        # would observe the run (no callback and no custom passes, which
+        # may act on empty circuits, e.g. state-preparation synthesis)
+        if callback is None and not self._custom_passes:
+            if isinstance(circuits, QuantumCircuit):
+                if not circuits.data:
+                    return circuits
+            elif isinstance(circuits, list) and all(
+                isinstance(circuit, QuantumCircuit) and not circuit.data
+                for circuit in circuits
+            ):
+                return circuits
 
+        return self.pass_manager.run(
+            circuits, callback=callback, num_processes=num_processes
+        )
 
-def _get_trial_count(default_trials=5):
-    if CONFIG.get("sabre_all_threads", None) or os.getenv(
-        "QISKIT_SABRE_ALL_THREADS"
-    ):
-        return default_num_processes()
-    return default_trials
+
+def _get_trial_count(default_trials=5, num_qubits=None):
+    """Number of Sabre layout/swap trials to request.
+
+    Trial cost scales linearly with the count, so when the all-threads
+    flag is off the default is capped by the circuit size hint: tiny
+    circuits gain nothing from extra trials.
+
+    Args:
+        default_trials (int): Trial count to use absent other signals.
+        num_qubits (int): (Optional) Size hint of the circuit being
+            routed, used to scale the count down for small circuits.
+    """
+    if _SABRE_ALL_THREADS:
+        return max(_DEFAULT_NUM_PROCESSES, 4)
+    if num_qubits is not None:
+        return max(4, min(default_trials, num_qubits // 2))
+    # Trials beyond the core count run serially in Sabre's thread pool;
+    # cap there (floored at 4 so quality doesn't collapse on small hosts)
+    return max(4, min(default_trials, _DEFAULT_NUM_PROCESSES))